@@ -1,38 +1,205 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import sqlite3, datetime, json, os, re, shutil
+import tkinter.font as tkfont
+import sqlite3, datetime, json, os, re, shutil, hashlib, io, threading, queue, logging
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from contextlib import contextmanager
+from functools import lru_cache
 from PIL import Image, ImageTk
 from tkcalendar import DateEntry, Calendar
+from db import get_conn
+
+# orjson is optional; without it settings go through the stdlib json module
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+    _json_loads = json.loads
+
+_log = logging.getLogger(__name__)
 
 # Ensure folders exist
 os.makedirs("data", exist_ok=True)
 os.makedirs("images", exist_ok=True)
+THUMB_DIR = ".thumb_cache"
+os.makedirs(THUMB_DIR, exist_ok=True)
+
+_SANITIZE_RE = re.compile(r'[^A-Za-z0-9_\-]')
+_STRIP_QUOTES = str.maketrans('', '', '"\'')
+_SORT_STRIP = '"\''
+# What a bad image file can raise while being thumbnailed (PIL.UnidentifiedImageError is an OSError)
+_IMAGE_ERRORS = (OSError, Image.DecompressionBombError)
+# Batched lookups take their keys as one JSON array so each statement's text never changes
+# and sqlite3's statement cache keeps it compiled
+_SQL_WRESTLER_FIELD = {
+    col: f"SELECT w.name,w.{col} FROM json_each(?) j JOIN wrestlers w ON w.name=j.value"
+    for col in ("brand", "gender", "image_path")
+}
+_SQL_TITLE_HOLDERS = "SELECT c.title,c.current_holder FROM json_each(?) j JOIN championships c ON c.title=j.value"
+
+Wrestler = namedtuple("Wrestler", "id name gender alignment brand image_path")
+
+# Bumped whenever update_schema gains a migration; stored in PRAGMA user_version
+SCHEMA_VERSION = 4
+
+# Init-time schema, compiled as one script each. executescript commits any open
+# transaction first, so the scripts carry their own BEGIN/COMMIT and run outside _tx.
+_TABLES_DDL = """
+BEGIN;
+CREATE TABLE IF NOT EXISTS match_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    card_date TEXT,
+    match_number INTEGER,
+    winner TEXT,
+    losers TEXT,
+    style TEXT,
+    championship TEXT
+);
+CREATE TABLE IF NOT EXISTS wrestlers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE,
+    gender TEXT,
+    alignment TEXT,
+    brand TEXT,
+    champion TEXT,
+    image_path TEXT
+);
+CREATE TABLE IF NOT EXISTS records (
+    wrestler TEXT PRIMARY KEY,
+    wins INTEGER DEFAULT 0,
+    losses INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS championships (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT,
+    brand TEXT,
+    current_holder TEXT,
+    type TEXT,
+    won_on TEXT,
+    gender TEXT
+);
+CREATE TABLE IF NOT EXISTS stables (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stable_name TEXT,
+    members TEXT
+);
+CREATE TABLE IF NOT EXISTS cards (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT,
+    brand TEXT,
+    card_date TEXT,
+    card_data TEXT
+);
+-- One row per wrestler per recorded match (role 'W' or 'L'); per-wrestler rollups
+-- go through idx_mp_wrestler instead of splitting winner/losers strings
+CREATE TABLE IF NOT EXISTS match_participants (
+    match_id INTEGER,
+    wrestler TEXT,
+    role TEXT,
+    FOREIGN KEY(match_id) REFERENCES match_history(id)
+);
+-- Pre-resized gallery thumbnails, read in one query per refresh
+CREATE TABLE IF NOT EXISTS thumbnails (
+    wrestler_id INTEGER PRIMARY KEY,
+    png BLOB,
+    mtime REAL
+);
+-- One row per (title, holder); replaces LIKE scans over current_holder
+CREATE TABLE IF NOT EXISTS title_holders (
+    title TEXT,
+    wrestler TEXT,
+    PRIMARY KEY(title, wrestler)
+);
+COMMIT;
+"""
+
+# Indexes for the brand/gender/title filters used by the refresh paths
+_INDEXES_DDL = """
+BEGIN;
+CREATE INDEX IF NOT EXISTS idx_wrestlers_brand ON wrestlers(brand);
+CREATE INDEX IF NOT EXISTS idx_wrestlers_brand_gender_alignment ON wrestlers(brand,gender,alignment);
+CREATE INDEX IF NOT EXISTS idx_champ_brand ON championships(brand);
+CREATE INDEX IF NOT EXISTS idx_champ_title ON championships(title);
+CREATE INDEX IF NOT EXISTS idx_th_wrestler ON title_holders(wrestler);
+CREATE INDEX IF NOT EXISTS idx_cards_date ON cards(card_date);
+CREATE INDEX IF NOT EXISTS idx_mp_wrestler ON match_participants(wrestler);
+CREATE INDEX IF NOT EXISTS idx_mp_match ON match_participants(match_id);
+-- (card_date, match_number) serves both the per-card lookup and the history scan order
+CREATE INDEX IF NOT EXISTS idx_mh_date_match ON match_history(card_date,match_number);
+COMMIT;
+"""
+
+def _load_blob_photo(png):
+    return ImageTk.PhotoImage(Image.open(io.BytesIO(png)))
 
 class StorylineApp:
     def __init__(self, root):
         self.root = root
         root.title("WWE Universe Manager")
         root.geometry("1600x1000")
+        root.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        # Database
-        self.conn = sqlite3.connect("data/roster.db")
+        # Database: the shared autocommit connection; multi-statement writes go through
+        # _tx() so each group is exactly one BEGIN/COMMIT
+        self.conn = get_conn()
         self.cursor = self.conn.cursor()
+        # _sort_key as an SQL function, so the sort_key column and Python sorts follow one rule
+        self.conn.create_function("sort_key_of", 1, lambda s: s and self._sort_key(s), deterministic=True)
+        self.cursor.execute("PRAGMA user_version")
+        self._db_version = self.cursor.fetchone()[0]
         self.create_tables()
-        self.update_schema()
+        with self._tx():
+            self.update_schema()
         self.load_settings()
 
         # State
         self.selected_wrestler_id = None
-        self._scroll_widget = None
-        self.mg_pool = []
+        self._selected_wrestler_name = None
+        self._selected_wrestler_stats = None
+        self._pending_refreshes = set()
+        self._refresh_scheduled = False
+        self._placeholders = {}
+        # Whole wrestlers table in sort order, shared by the roster views; None = reload
+        self._roster_cache = None
+        # brand ("All" included) -> {alignment/gender: count}; None = recount, cleared with the roster
+        self._stats_cache = None
+        # Treeview -> {iid: values} as last displayed, for _sync_tree
+        self._tree_values = {}
+        # (imgpath, mtime, size) -> PhotoImage for match generator and card thumbnails
+        self._thumb_cache = {}
+        # Decodes match generator and roster gallery thumbnails off the Tk thread
+        self._thumb_pool = ThreadPoolExecutor(max_workers=4)
+        # Workers never touch Tk: finished futures go on _thumb_results and the Tk thread
+        # drains them with its own after() poll
+        self._thumb_results = queue.Queue()
+        self._thumb_outstanding = 0
+        self._thumb_poll_id = None
+        self._thumb_waiters = {}
+        # Available wrestlers as name -> None, kept in sort order; a dict gives O(1)
+        # membership and removal while preserving display order
+        self.mg_pool = {}
+        # name -> (name, brand, gender, image_path) for the current generator brand
+        self.mg_meta = {}
         self.booked_matches = []
+        self._match_frames = []
         self.card_ids = []
-
-        # Apply saved font
-        self.root.option_add("*Font", (self.font, 10))
+        self._last_card_date = None
+        # card id -> (name, brand, card_date, parsed card_data)
+        self._card_json_cache = {}
+
+        # Apply saved font through named fonts: Tk resolves them once, ttk widgets pick up the
+        # style default, and apply_font only has to reconfigure the family
+        self._app_font = tkfont.Font(family=self.font, size=10)
+        self._italic8 = tkfont.Font(family=self.font, size=8, slant="italic")
+        self._italic9 = tkfont.Font(family=self.font, size=9, slant="italic")
+        self.root.option_add("*Font", self._app_font)
+        ttk.Style().configure(".", font=self._app_font)
 
         # Notebook
-        nb = ttk.Notebook(root)
+        nb = self.nb = ttk.Notebook(root)
         nb.pack(fill="both", expand=True)
         self.roster_tab    = tk.Frame(nb)
         self.match_gen_tab = tk.Frame(nb)
@@ -43,100 +210,163 @@ class StorylineApp:
         nb.add(self.settings_tab,  text="Settings")
         nb.add(self.cards_tab,     text="Cards")
 
-        # Build UI
+        # Build UI; only the roster tab is built up front, the rest on first visit
         self.build_roster_tab(self.roster_tab)
-        self.build_match_generator_tab(self.match_gen_tab)
-        self.build_settings_tab(self.settings_tab)
-        self.build_cards_tab(self.cards_tab)
+        # tab path -> builder still waiting for that tab's first <<NotebookTabChanged>>
+        self._lazy_tabs = {
+            str(self.match_gen_tab): self._init_match_gen_tab,
+            str(self.settings_tab):  lambda: self.build_settings_tab(self.settings_tab),
+            str(self.cards_tab):     self._init_cards_tab,
+        }
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Initial load
         self.refresh_gallery()
         self.refresh_stats()
         self.refresh_rc_tree()
         self.refresh_stables()
+
+    # Lazy tabs
+    def _on_tab_changed(self, e=None):
+        self._ensure_tab(self.nb.select())
+
+    def _ensure_tab(self, tab):
+        build = self._lazy_tabs.pop(str(tab), None)
+        if build: build()
+
+    def _init_match_gen_tab(self):
+        self.build_match_generator_tab(self.match_gen_tab)
         self.reset_mg_pool()
         self.load_match_gen_roster()
         self.refresh_card()
-        self.on_card_date_selected()
 
-        # Mouse-wheel scrolling
-        root.bind_all("<MouseWheel>", self._on_mousewheel)
+    def _init_cards_tab(self):
+        self.build_cards_tab(self.cards_tab)
+        self.on_card_date_selected()
 
-    # Utility for sorting
-    def _sort_key(self, name):
-        return name.lstrip('"\'' ).lower()
+    # Utility for sorting; memoized since the same names are re-sorted on every pool change
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _sort_key(name):
+        return name.lstrip(_SORT_STRIP).casefold()
 
     # Database & Schema
     def create_tables(self):
-        # Drop and recreate match_history to ensure correct schema
-        self.cursor.execute("DROP TABLE IF EXISTS match_history")
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS match_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                card_date TEXT,
-                match_number INTEGER,
-                winner TEXT,
-                losers TEXT,
-                style TEXT,
-                championship TEXT
-            )""")
-        # Other tables
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS wrestlers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE,
-                gender TEXT,
-                alignment TEXT,
-                brand TEXT,
-                champion TEXT,
-                image_path TEXT
-            )""")
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS records (
-                wrestler TEXT PRIMARY KEY,
-                wins INTEGER DEFAULT 0,
-                losses INTEGER DEFAULT 0
-            )""")
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS championships (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                brand TEXT,
-                current_holder TEXT,
-                type TEXT,
-                won_on TEXT,
-                gender TEXT
-            )""")
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS stables (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                stable_name TEXT,
-                members TEXT
-            )""")
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS cards (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT,
-                brand TEXT,
-                card_date TEXT,
-                card_data TEXT
-            )""")
-        self.conn.commit()
+        self.cursor.executescript(_TABLES_DDL)
+        # Bring an older match_history up to date in place (it used to be dropped on startup);
+        # done before the indexes because idx_mh_date_match needs card_date
+        if self._db_version < SCHEMA_VERSION:
+            with self._tx():
+                self.cursor.execute("PRAGMA table_info(match_history)")
+                mh_cols = {c[1] for c in self.cursor.fetchall()}
+                for col, typ in (("card_date","TEXT"), ("match_number","INTEGER"), ("winner","TEXT"),
+                                 ("losers","TEXT"), ("style","TEXT"), ("championship","TEXT")):
+                    if col not in mh_cols:
+                        self.cursor.execute(f"ALTER TABLE match_history ADD COLUMN {col} {typ}")
+        self.cursor.executescript(_INDEXES_DDL)
+        # Older databases were created without UNIQUE on name; fall back if they hold duplicates
+        try:
+            self.cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_wrestlers_name ON wrestlers(name)")
+        except sqlite3.IntegrityError:
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_wrestlers_name ON wrestlers(name)")
+        # Gather planner statistics the first time the indexes exist
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE name='sqlite_stat1'")
+        if not self.cursor.fetchone():
+            self.cursor.execute("ANALYZE")
+
+    @contextmanager
+    def _tx(self):
+        # Group multi-row writes into one transaction (one commit instead of one per row)
+        self.cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.cursor
+        except Exception:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
 
     def update_schema(self):
+        # Migrations run once; afterwards user_version lets startup skip the probes
+        if self._db_version >= SCHEMA_VERSION: return
         self.cursor.execute("PRAGMA table_info(wrestlers)")
         cols = [c[1] for c in self.cursor.fetchall()]
         if "champion" not in cols:
             self.cursor.execute("ALTER TABLE wrestlers ADD COLUMN champion TEXT")
         if "image_path" not in cols:
             self.cursor.execute("ALTER TABLE wrestlers ADD COLUMN image_path TEXT")
-        self.conn.commit()
+        # Backfill title_holders from the legacy " & "-joined holder strings
+        self.cursor.execute("SELECT 1 FROM title_holders LIMIT 1")
+        if not self.cursor.fetchone():
+            self.cursor.execute("SELECT title,current_holder FROM championships")
+            self.cursor.executemany(
+                "INSERT OR IGNORE INTO title_holders(title,wrestler) VALUES(?,?)",
+                [(t, h) for t, holder in self.cursor.fetchall() for h in (holder or "").split(" & ") if h]
+            )
+        # Backfill match_participants from the legacy winner/losers strings
+        self.cursor.execute("SELECT 1 FROM match_participants LIMIT 1")
+        if not self.cursor.fetchone():
+            self.cursor.execute("SELECT id,winner,losers FROM match_history ORDER BY id")
+            self.cursor.executemany(
+                "INSERT INTO match_participants(match_id,wrestler,role) VALUES(?,?,?)",
+                [(mid, nm, role) for mid, winner, losers in self.cursor.fetchall()
+                 for names, role in (((winner or "").split(" & "), "W"), ((losers or "").split(","), "L"))
+                 for nm in names if nm]
+            )
+        # Persisted sort keys (computed by _sort_key itself) so ORDER BY can use an index
+        for table, col in (("wrestlers","name"), ("championships","title"), ("stables","stable_name")):
+            key_expr = f"sort_key_of({{}}.{col})"
+            self.cursor.execute(f"PRAGMA table_info({table})")
+            if "sort_key" not in [c[1] for c in self.cursor.fetchall()]:
+                self.cursor.execute(f"ALTER TABLE {table} ADD COLUMN sort_key TEXT")
+                self.cursor.execute(f"UPDATE {table} SET sort_key={key_expr.format(table)}")
+            self.cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_sort ON {table}(sort_key)")
+            for name, event in (("insert", "INSERT"), ("update", f"UPDATE OF {col}")):
+                self.cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_{table}_sort_{name}
+                    AFTER {event} ON {table} BEGIN
+                        UPDATE {table} SET sort_key={key_expr.format("NEW")} WHERE id=NEW.id;
+                    END""")
+        # Superseded by idx_mh_date_match
+        self.cursor.execute("DROP INDEX IF EXISTS idx_mh_date")
+        self.cursor.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._db_version = SCHEMA_VERSION
+
+    def _invalidate_roster(self):
+        self._roster_cache = self._stats_cache = None
+
+    def _load_roster(self):
+        if self._roster_cache is None:
+            self.cursor.execute(
+                "SELECT id,name,gender,alignment,brand,image_path FROM wrestlers ORDER BY sort_key,id"
+            )
+            self._roster_cache = [Wrestler(*row) for row in self.cursor.fetchall()]
+        return self._roster_cache
+
+    # Deferred refreshes: each requested kind runs once per idle cycle
+    def _schedule_refresh(self, kinds):
+        self._pending_refreshes |= set(kinds)
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.root.after_idle(self._flush_refreshes)
+
+    def _flush_refreshes(self):
+        pending, self._pending_refreshes = self._pending_refreshes, set()
+        self._refresh_scheduled = False
+        for kind, refresh in (("gallery", self.refresh_gallery), ("stats", self.refresh_stats),
+                              ("stables", self.refresh_stable_list), ("rc_tree", self.refresh_rc_tree),
+                              ("st_tree", self.refresh_stables)):
+            if kind in pending: refresh()
 
     # Settings Persistence
     def load_settings(self):
+        # Bytes last written/read, so save_settings can skip writes that change nothing
+        self._last_settings_bytes = None
         if os.path.exists("settings.json"):
-            with open("settings.json","r") as f:
-                data = json.load(f)
+            with open("settings.json","rb") as f:
+                raw = f.read()
+            data = _json_loads(raw)
+            self._last_settings_bytes = raw
             self.custom_match_types = data.get("custom_match_types", [])
             self.font = data.get("font", "Arial")
         else:
@@ -144,16 +374,21 @@ class StorylineApp:
             self.font = "Arial"
 
     def save_settings(self):
-        with open("settings.json","w") as f:
-            json.dump({
-                "custom_match_types": self.custom_match_types,
-                "font": self.font
-            }, f)
+        payload = _json_dumps({
+            "custom_match_types": self.custom_match_types,
+            "font": self.font
+        })
+        if payload == self._last_settings_bytes: return
+        with open("settings.json","wb") as f:
+            f.write(payload)
+        self._last_settings_bytes = payload
 
     # Mousewheel Handler
-    def _on_mousewheel(self, event):
-        if self._scroll_widget:
-            self._scroll_widget.yview_scroll(int(-1*(event.delta/120)), "units")
+    def _bind_wheel(self, target, *widgets):
+        # Scroll `target` while the pointer is over any of `widgets`. Treeviews and
+        # listboxes already scroll themselves through their class bindings.
+        for w in widgets:
+            w.bind("<MouseWheel>", lambda e: target.yview_scroll(int(-1*(e.delta/120)), "units"))
 
     # Roster Management Tab
     def build_roster_tab(self, frame):
@@ -211,8 +446,7 @@ class StorylineApp:
         ml_vsb.grid(row=2,column=3,sticky="ns")
         ml_canvas.create_window((0,0),window=ml_frame,anchor="nw")
         ml_frame.bind("<Configure>",lambda e:ml_canvas.configure(scrollregion=ml_canvas.bbox("all")))
-        ml_canvas.bind("<Enter>",lambda e:setattr(self,"_scroll_widget",ml_canvas))
-        ml_canvas.bind("<Leave>",lambda e:setattr(self,"_scroll_widget",None))
+        self._bind_wheel(ml_canvas, ml_canvas, ml_frame)
         tk.Label(champ_frame,text="Hold CTRL to select multiple",font=("Arial",8,"italic")).grid(row=3,column=0,columnspan=3)
         self.rc_multilist = tk.Listbox(ml_frame,selectmode="extended",height=5,width=60)
         self.rc_multilist.pack(fill="both",expand=True)
@@ -227,8 +461,6 @@ class StorylineApp:
         self.rc_tree = ttk.Treeview(form,columns=("Title","Holder"),show="headings",height=5)
         self.rc_tree.heading("Title",text="Title");self.rc_tree.heading("Holder",text="Holder")
         self.rc_tree.grid(row=10,column=0,columnspan=3,sticky="nsew")
-        self.rc_tree.bind("<Enter>",lambda e:setattr(self,"_scroll_widget",self.rc_tree))
-        self.rc_tree.bind("<Leave>",lambda e:setattr(self,"_scroll_widget",None))
         btnf = tk.Frame(form);btnf.grid(row=11,column=0,columnspan=3,pady=5)
         tk.Button(btnf,text="Add",command=self.open_champ_popup).pack(side="left",padx=5)
         tk.Button(btnf,text="Update",command=self.open_champ_update_popup).pack(side="left",padx=5)
@@ -246,8 +478,7 @@ class StorylineApp:
         sl_vsb.grid(row=13,column=3,sticky="ns")
         sl_canvas.create_window((0,0),window=sl_frame,anchor="nw")
         sl_frame.bind("<Configure>",lambda e:sl_canvas.configure(scrollregion=sl_canvas.bbox("all")))
-        sl_canvas.bind("<Enter>",lambda e:setattr(self,"_scroll_widget",sl_canvas))
-        sl_canvas.bind("<Leave>",lambda e:setattr(self,"_scroll_widget",None))
+        self._bind_wheel(sl_canvas, sl_canvas, sl_frame)
         tk.Label(form,text="Hold CTRL to select members",font=("Arial",8,"italic")).grid(row=14,column=0,columnspan=3)
         self.stable_multilist = tk.Listbox(sl_frame,selectmode="extended",height=5,width=60)
         self.stable_multilist.pack(fill="both",expand=True)
@@ -258,8 +489,6 @@ class StorylineApp:
         self.st_tree = ttk.Treeview(form,columns=("Name","Members"),show="headings",height=5)
         self.st_tree.heading("Name",text="Name");self.st_tree.heading("Members",text="Members")
         self.st_tree.grid(row=16,column=0,columnspan=3,sticky="nsew")
-        self.st_tree.bind("<Enter>",lambda e:setattr(self,"_scroll_widget",self.st_tree))
-        self.st_tree.bind("<Leave>",lambda e:setattr(self,"_scroll_widget",None))
         self.refresh_stable_list()
 
         # Roster gallery
@@ -273,19 +502,165 @@ class StorylineApp:
         vsb = ttk.Scrollbar(right,orient="vertical",command=canvas.yview)
         canvas.configure(yscrollcommand=vsb.set)
         vsb.pack(side="right",fill="y");canvas.pack(side="left",fill="both",expand=True)
-        canvas.bind("<Enter>",lambda e:setattr(self,"_scroll_widget",canvas))
-        canvas.bind("<Leave>",lambda e:setattr(self,"_scroll_widget",None))
+        self.gallery_canvas = canvas
         self.gallery_inner = tk.Frame(canvas)
+        self._bind_wheel(canvas, canvas, self.gallery_inner)
         canvas.create_window((0,0),window=self.gallery_inner,anchor="nw")
         self.gallery_inner.bind("<Configure>",lambda e:canvas.configure(scrollregion=canvas.bbox("all")))
-        right.bind("<Configure>",lambda e:(setattr(self,"gallery_cols",max(1,e.width//140)),self.refresh_gallery()))
+        right.bind("<Configure>",self._on_right_configure)
         self.gallery_cols=5
+        self._gallery_width=None
+        self._resize_after_id=None
         self._thumb_refs=[]
+        self._cell_widgets={}
+        self._gallery_photos={}  # wrestler id -> decoded gallery thumbnail
+        self._gallery_pending=set()  # wrestler ids with a thumbnail being built on the pool
 
     # ---------- Helper Methods for Roster ----------
+    def _scan_images(self):
+        # One directory listing per refresh instead of a stat() per wrestler
+        return {os.path.normcase(e.path) for e in os.scandir("images") if e.is_file()}
+
+    def _image_exists(self, imgpath, existing):
+        key = os.path.normcase(os.path.normpath(imgpath))
+        if os.path.dirname(key) == os.path.normcase("images"):
+            return key in existing
+        return os.path.exists(imgpath)
+
+    def _get_placeholder(self, size=(100,100)):
+        # One shared gray square per size; Tk images can back any number of labels
+        if size not in self._placeholders:
+            self._placeholders[size] = ImageTk.PhotoImage(Image.new("RGB",size,(200,200,200)))
+        return self._placeholders[size]
+
+    def _on_right_configure(self, e):
+        # Debounce: only the last <Configure> in a 150 ms window rebuilds the gallery
+        self._gallery_width = e.width
+        if self._resize_after_id:
+            self.root.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        # Height-only changes (or widths that land on the same column count) need no reflow
+        if max(1, e.width // 140) == self.gallery_cols and self._cell_widgets: return
+        self._resize_after_id = self.root.after(150, self._apply_resize)
+
+    def _apply_resize(self):
+        self._resize_after_id = None
+        self.gallery_cols = max(1, self._gallery_width // 140)
+        self.refresh_gallery()
+
+    def _thumb_png(self, imgpath, size=(100,100)):
+        img = Image.open(imgpath)
+        # Let libjpeg decode at a reduced DCT scale; no-op for other formats
+        img.draft("RGB", (size[0]*2, size[1]*2))
+        img.thumbnail(size, Image.BILINEAR)
+        if img.mode not in ("RGB","RGBA","L","LA","P"):
+            img = img.convert("RGBA")
+        buf = io.BytesIO()
+        img.save(buf, "PNG", optimize=True)
+        return buf.getvalue()
+
+    def _cached_thumb(self, imgpath, size=(60,60)):
+        # Keyed on mtime so a replaced image is picked up on the next render
+        return self._thumb_cache.get((imgpath, os.path.getmtime(imgpath), size))
+
+    def _thumb_image(self, imgpath, size=(60,60)):
+        # PIL and file I/O only, so this is safe to run on the thumbnail pool
+        mtime = os.path.getmtime(imgpath)
+        key = hashlib.blake2b(f"{imgpath}|{mtime}|{size[0]}x{size[1]}".encode(), digest_size=8).hexdigest()
+        thumb_path = os.path.join(THUMB_DIR, f"{key}.png")
+        if not os.path.exists(thumb_path):
+            tmp = f"{thumb_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(self._thumb_png(imgpath, size))
+            os.replace(tmp, thumb_path)
+        img = Image.open(thumb_path); img.load()
+        return (imgpath, mtime, size), img
+
+    def _cache_photo(self, mem_key, img):
+        # PhotoImage creation must happen on the Tk thread
+        photo = self._thumb_cache.get(mem_key)
+        if photo is None:
+            photo = self._thumb_cache[mem_key] = ImageTk.PhotoImage(img)
+        return photo
+
+    def _get_thumb(self, imgpath, size=(60,60)):
+        photo = self._cached_thumb(imgpath, size)
+        return photo if photo is not None else self._cache_photo(*self._thumb_image(imgpath, size))
+
+    def _submit_thumb(self, work, imgpath, done, *args):
+        # Run work(imgpath) on the pool; done(*args, future) is called later on the Tk thread
+        fut = self._thumb_pool.submit(work, imgpath)
+        fut.add_done_callback(lambda f: self._thumb_results.put((done, args + (f,))))
+        self._thumb_outstanding += 1
+        if self._thumb_poll_id is None:
+            self._thumb_poll_id = self.root.after(30, self._drain_thumb_results)
+
+    def _drain_thumb_results(self):
+        self._thumb_poll_id = None
+        try:
+            while True:
+                try: done, args = self._thumb_results.get_nowait()
+                except queue.Empty: break
+                self._thumb_outstanding -= 1
+                done(*args)
+        finally:
+            # Keep polling only while decodes are still out
+            if self._thumb_outstanding:
+                self._thumb_poll_id = self.root.after(30, self._drain_thumb_results)
+
+    def _on_close(self):
+        # Drop queued decodes so closing neither waits for them nor runs their callbacks
+        if self._thumb_poll_id: self.root.after_cancel(self._thumb_poll_id)
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _request_thumb(self, imgpath, lbl=None):
+        # One in-flight decode per image; labels queued here get the photo when it lands
+        waiters = self._thumb_waiters.get(imgpath)
+        if waiters is None:
+            waiters = self._thumb_waiters[imgpath] = []
+            self._submit_thumb(self._thumb_image, imgpath, self._thumb_done, imgpath)
+        if lbl is not None:
+            waiters.append(lbl)
+
+    def _thumb_done(self, imgpath, fut):
+        waiters = self._thumb_waiters.pop(imgpath, [])
+        exc = fut.exception()
+        if exc is not None:
+            return _log.warning("Could not build thumbnail for %s", imgpath, exc_info=exc)
+        photo = self._cache_photo(*fut.result())
+        for lbl in waiters:
+            if lbl.winfo_exists():
+                lbl.configure(image=photo); lbl.image = photo
+
+    def _source_mtime(self, imgpath):
+        try:
+            return os.path.getmtime(imgpath) if imgpath else None
+        except OSError:
+            return None
+
+    def _thumb_blob(self, imgpath):
+        # (png, source mtime) for the thumbnails table; the mtime is read first so an image
+        # replaced mid-decode is simply rebuilt on the next read
+        mtime = os.path.getmtime(imgpath)
+        return self._thumb_png(imgpath), mtime
+
+    def _store_thumb(self, wid, imgpath):
+        # Keep the gallery thumbnail BLOB in step with the wrestler's image; a missing or
+        # unreadable image drops the BLOB so the save still succeeds with a placeholder
+        try:
+            png, mtime = self._thumb_blob(imgpath) if imgpath else (None, None)
+        except _IMAGE_ERRORS:
+            png = None
+        if png is not None:
+            self.cursor.execute(
+                "INSERT OR REPLACE INTO thumbnails(wrestler_id,png,mtime) VALUES(?,?,?)", (wid, png, mtime)
+            )
+        else:
+            self.cursor.execute("DELETE FROM thumbnails WHERE wrestler_id=?", (wid,))
+
     def sanitize_filename(self, name):
-        name = name.replace('"','').replace("'", "")
-        return re.sub(r'[^A-Za-z0-9_\-]', '_', name)
+        return _SANITIZE_RE.sub('_', name.translate(_STRIP_QUOTES))
 
     def upload_image(self):
         path = filedialog.askopenfilename(filetypes=[("Images","*.png *.jpg *.jpeg *.gif")])
@@ -307,14 +682,16 @@ class StorylineApp:
         if not all([n,g,a,b]):
             return messagebox.showwarning("Missing Info", "Please fill in all fields.")
         try:
-            self.cursor.execute(
-                "INSERT INTO wrestlers(name,gender,alignment,brand,champion,image_path) VALUES(?,?,?,?,?,?)",
-                (n,g,a,b,"",img)
-            )
-            self.conn.commit()
+            with self._tx():
+                self.cursor.execute(
+                    "INSERT INTO wrestlers(name,gender,alignment,brand,champion,image_path) VALUES(?,?,?,?,?,?)",
+                    (n,g,a,b,"",img)
+                )
+                self._store_thumb(self.cursor.lastrowid, img)
         except sqlite3.IntegrityError:
             return messagebox.showerror("Error", "A wrestler with that name already exists.")
-        self.refresh_gallery(); self.refresh_stats(); self.refresh_stable_list()
+        self._invalidate_roster()
+        self._schedule_refresh({"gallery","stats","stables"})
 
     def select_wrestler(self, name):
         self.cursor.execute(
@@ -324,6 +701,8 @@ class StorylineApp:
         if not row: return
         wid,n,g,a,b,img = row
         self.selected_wrestler_id = wid
+        self._selected_wrestler_name = n
+        self._selected_wrestler_stats = (g,a,b)
         self.name_e.delete(0, tk.END); self.name_e.insert(0, n)
         self.gender_v.set(g); self.align_v.set(a)
         self.brand_v.set(b); self.image_path_v.set(img or "")
@@ -340,71 +719,140 @@ class StorylineApp:
         )
         if not all([n,g,a,b]):
             return messagebox.showwarning("Missing Info", "Please fill in all fields for the update.")
-        self.cursor.execute(
-            "UPDATE wrestlers SET name=?,gender=?,alignment=?,brand=?,image_path=? WHERE id=?",
-            (n,g,a,b,img,self.selected_wrestler_id)
-        )
-        self.conn.commit()
-        self.refresh_gallery(); self.refresh_stats(); self.refresh_stable_list()
+        with self._tx():
+            self.cursor.execute(
+                "UPDATE wrestlers SET name=?,gender=?,alignment=?,brand=?,image_path=? WHERE id=?",
+                (n,g,a,b,img,self.selected_wrestler_id)
+            )
+            self._store_thumb(self.selected_wrestler_id, img)
+        self._gallery_photos.pop(self.selected_wrestler_id, None)
+        self.mg_meta.pop(self._selected_wrestler_name, None); self.mg_meta.pop(n, None)
+        self._invalidate_roster()
+        # Stats only change with gender/alignment/brand, the member list only with the name
+        stats_changed = (g,a,b) != self._selected_wrestler_stats
+        name_changed = n != self._selected_wrestler_name
+        self._selected_wrestler_name, self._selected_wrestler_stats = n, (g,a,b)
+        kinds = {"gallery"}
+        if stats_changed: kinds.add("stats")
+        if name_changed: kinds.add("stables")
+        self._schedule_refresh(kinds)
 
     def delete_wrestler(self):
         if self.selected_wrestler_id is None:
             return messagebox.showwarning("No Selection", "Please select a wrestler to delete.")
-        self.cursor.execute("DELETE FROM wrestlers WHERE id=?", (self.selected_wrestler_id,))
-        self.conn.commit()
+        with self._tx():
+            self.cursor.execute("DELETE FROM wrestlers WHERE id=?", (self.selected_wrestler_id,))
+            self.cursor.execute("DELETE FROM thumbnails WHERE wrestler_id=?", (self.selected_wrestler_id,))
+        self.mg_meta.pop(self._selected_wrestler_name, None)
+        self._gallery_photos.pop(self.selected_wrestler_id, None)
+        self._invalidate_roster()
         self.selected_wrestler_id = None
-        self.refresh_gallery(); self.refresh_stats(); self.refresh_stable_list()
+        self._selected_wrestler_name = self._selected_wrestler_stats = None
+        self._schedule_refresh({"gallery","stats","stables"})
 
     def refresh_gallery(self):
-        for w in self.gallery_inner.winfo_children(): w.destroy()
         self._thumb_refs.clear()
         f = self.gallery_filter.get()
-        if f == "All":
-            self.cursor.execute("SELECT id,name,image_path FROM wrestlers")
-        else:
+        rows = [(w.id, w.name, w.image_path) for w in self._load_roster() if f == "All" or w.brand == f]
+        # Prefetch records and title holders once instead of per cell
+        self.cursor.execute("SELECT wrestler,wins,losses FROM records")
+        records_map = {w: (wins, losses) for w, wins, losses in self.cursor.fetchall()}
+        titles_map = defaultdict(list)
+        self.cursor.execute("SELECT wrestler,title FROM title_holders")
+        for wrestler, title in self.cursor.fetchall():
+            titles_map[wrestler].append(title)
+        # Only cells for names that left the view are destroyed; the rest are reused
+        names = {r[1] for r in rows}
+        for name in list(self._cell_widgets):
+            if name not in names:
+                self._cell_widgets.pop(name)[0].destroy()
+        # Decoded photos are kept per wrestler id; only ids without one read their BLOB, and a
+        # BLOB is used only while its source still has the mtime it was built from
+        missing = [wid for wid, _, _ in rows if wid not in self._gallery_photos]
+        thumbs = {}
+        if missing:
             self.cursor.execute(
-                "SELECT id,name,image_path FROM wrestlers WHERE brand=?", (f,)
+                "SELECT t.wrestler_id,t.png,t.mtime FROM json_each(?) j JOIN thumbnails t ON t.wrestler_id=j.value",
+                (json.dumps(missing),)
             )
-        rows = self.cursor.fetchall()
-        rows.sort(key=lambda r: self._sort_key(r[1]))
+            thumbs = {wid: (png, mtime) for wid, png, mtime in self.cursor.fetchall()}
+        existing = None  # images/ listing, taken once the first row needs a file check
         cols = self.gallery_cols
         for idx, (wid, name, imgpath) in enumerate(rows):
             r,c = divmod(idx, cols)
-            cell = tk.Frame(self.gallery_inner, bd=1, relief="solid", padx=5, pady=5)
-            cell.grid(row=r, column=c, padx=10, pady=10)
-            if imgpath and os.path.exists(imgpath):
-                img = Image.open(imgpath); img.thumbnail((100,100))
-                photo = ImageTk.PhotoImage(img)
+            if name in self._cell_widgets:
+                cell, lbl, text_lbl, titles_lbl = self._cell_widgets[name]
+                cell.grid_configure(row=r, column=c)
             else:
-                photo = ImageTk.PhotoImage(Image.new("RGB",(100,100),(200,200,200)))
-            lbl = tk.Label(cell, image=photo); lbl.image=photo; lbl.pack()
+                cell = tk.Frame(self.gallery_inner, bd=1, relief="solid", padx=5, pady=5)
+                cell.grid(row=r, column=c, padx=10, pady=10)
+                lbl = tk.Label(cell); lbl.pack()
+                text_lbl = tk.Label(cell, wraplength=100); text_lbl.pack()
+                titles_lbl = tk.Label(cell, wraplength=100, font=self._italic8)
+                lbl.bind("<Button-1>", lambda e,nm=name: self.select_wrestler(nm))
+                self._bind_wheel(self.gallery_canvas, cell, lbl, text_lbl, titles_lbl)
+                self._cell_widgets[name] = (cell, lbl, text_lbl, titles_lbl)
+            photo = self._get_placeholder()
+            png, mtime = thumbs.get(wid, (None, None))
+            if wid in self._gallery_photos:
+                photo = self._gallery_photos[wid]
+            elif png is not None and mtime == self._source_mtime(imgpath):
+                photo = self._gallery_photos[wid] = _load_blob_photo(png)
+            elif imgpath:
+                if existing is None: existing = self._scan_images()
+                if self._image_exists(imgpath, existing):
+                    # No BLOB yet, or the image changed since it was made: resize on the pool
+                    # and store when it lands
+                    self._request_gallery_thumb(wid, name, imgpath)
+            lbl.config(image=photo); lbl.image=photo
             self._thumb_refs.append(photo)
-            self.cursor.execute("SELECT wins,losses FROM records WHERE wrestler=?", (name,))
-            rec = self.cursor.fetchone() or (0,0)
-            tk.Label(cell, text=f"{name}\n{rec[0]}–{rec[1]}", wraplength=100).pack()
-            self.cursor.execute(
-                "SELECT title FROM championships WHERE current_holder LIKE ?", (f"%{name}%",)
-            )
-            titles = [r[0] for r in self.cursor.fetchall()]
+            rec = records_map.get(name, (0,0))
+            text_lbl.config(text=f"{name}\n{rec[0]}–{rec[1]}")
+            titles = titles_map.get(name, [])
             if titles:
-                tk.Label(cell, text="Titles: "+", ".join(titles),
-                         wraplength=100, font=(self.font,8,"italic")).pack()
-            lbl.bind("<Button-1>", lambda e,nm=name: self.select_wrestler(nm))
+                titles_lbl.config(text="Titles: "+", ".join(titles)); titles_lbl.pack()
+            else:
+                titles_lbl.config(text=""); titles_lbl.pack_forget()
+
+    def _request_gallery_thumb(self, wid, name, imgpath):
+        if wid in self._gallery_pending: return
+        self._gallery_pending.add(wid)
+        self._submit_thumb(self._thumb_blob, imgpath, self._gallery_thumb_done, wid, name, imgpath)
+
+    def _gallery_thumb_done(self, wid, name, imgpath, fut):
+        # Back on the Tk thread: persist the BLOB and swap it into the cell if it's still current
+        self._gallery_pending.discard(wid)
+        exc = fut.exception()
+        if exc is not None:
+            return _log.warning("Could not build thumbnail for %s", imgpath, exc_info=exc)
+        self.cursor.execute("SELECT 1 FROM wrestlers WHERE id=? AND image_path=?", (wid, imgpath))
+        if not self.cursor.fetchone(): return
+        png, mtime = fut.result()
+        self.cursor.execute(
+            "INSERT OR REPLACE INTO thumbnails(wrestler_id,png,mtime) VALUES(?,?,?)", (wid, png, mtime)
+        )
+        photo = self._gallery_photos[wid] = _load_blob_photo(png)
+        if name in self._cell_widgets:
+            lbl = self._cell_widgets[name][1]
+            lbl.config(image=photo); lbl.image = photo
+            self._thumb_refs.append(photo)
 
     def refresh_stats(self):
         f = self.gallery_filter.get()
-        if f == "All":
-            total = self.cursor.execute("SELECT COUNT(*) FROM wrestlers").fetchone()[0]
-            face  = self.cursor.execute("SELECT COUNT(*) FROM wrestlers WHERE alignment='Face'").fetchone()[0]
-            heel  = self.cursor.execute("SELECT COUNT(*) FROM wrestlers WHERE alignment='Heel'").fetchone()[0]
-            male  = self.cursor.execute("SELECT COUNT(*) FROM wrestlers WHERE gender='Male'").fetchone()[0]
-            female= self.cursor.execute("SELECT COUNT(*) FROM wrestlers WHERE gender='Female'").fetchone()[0]
-        else:
-            total = self.cursor.execute("SELECT COUNT(*) FROM wrestlers WHERE brand=?", (f,)).fetchone()[0]
-            face  = self.cursor.execute("SELECT COUNT(*) FROM wrestlers WHERE brand=? AND alignment='Face'", (f,)).fetchone()[0]
-            heel  = self.cursor.execute("SELECT COUNT(*) FROM wrestlers WHERE brand=? AND alignment='Heel'", (f,)).fetchone()[0]
-            male  = self.cursor.execute("SELECT COUNT(*) FROM wrestlers WHERE brand=? AND gender='Male'", (f,)).fetchone()[0]
-            female= self.cursor.execute("SELECT COUNT(*) FROM wrestlers WHERE brand=? AND gender='Female'", (f,)).fetchone()[0]
+        # One GROUP BY per roster change covers every brand; filter changes just pick a row
+        if self._stats_cache is None:
+            self._stats_cache = defaultdict(lambda: defaultdict(int))
+            self.cursor.execute(
+                "SELECT brand,alignment,gender,COUNT(*) FROM wrestlers GROUP BY brand,alignment,gender"
+            )
+            for brand, align, gender, n in self.cursor.fetchall():
+                for b in (brand, "All"):
+                    c = self._stats_cache[b]
+                    c[align] += n; c[gender] += n; c["total"] += n
+        counts = self._stats_cache.get(f, {})
+        total = counts.get("total", 0)
+        face, heel = counts.get("Face", 0), counts.get("Heel", 0)
+        male, female = counts.get("Male", 0), counts.get("Female", 0)
         self.stats_label.config(
             text=f"Stats for {f}:\nTotal: {total} | Face: {face} | Heel: {heel}\nMale: {male} | Female: {female}"
         )
@@ -412,13 +860,10 @@ class StorylineApp:
     # ---------- Championship Methods ----------
     def refresh_rc_titles(self):
         b = self.rc_champ_brand_v.get()
-        if b == "All":
-            self.cursor.execute("SELECT title FROM championships")
-        else:
-            self.cursor.execute("SELECT title FROM championships WHERE brand=?", (b,))
-        titles = [r[0] for r in self.cursor.fetchall()]
-        titles.sort(key=self._sort_key)
-        self.rc_title_cb['values'] = titles
+        self.cursor.execute(
+            "SELECT title FROM championships WHERE (?='All' OR brand=?) ORDER BY sort_key", (b,b)
+        )
+        self.rc_title_cb['values'] = [t for (t,) in self.cursor]
         self.rc_title_v.set("")
         self.rc_multilist.delete(0, tk.END)
 
@@ -429,17 +874,13 @@ class StorylineApp:
         self.cursor.execute("SELECT gender,brand FROM championships WHERE title=?", (title,))
         row = self.cursor.fetchone()
         gender, champ_brand = (row if row else (None,None))
-        q = "SELECT name FROM wrestlers WHERE 1=1"
-        params = []
-        if gender:
-            q += " AND gender=?"; params.append(gender)
-        if champ_brand and champ_brand != "All":
-            q += " AND brand=?"; params.append(champ_brand)
-        self.cursor.execute(q, tuple(params))
-        names = [r[0] for r in self.cursor.fetchall()]
-        names.sort(key=self._sort_key)
-        for nm in names:
-            self.rc_multilist.insert(tk.END, nm)
+        # None disables a filter
+        gender = gender or None
+        champ_brand = champ_brand if champ_brand and champ_brand != "All" else None
+        self.rc_multilist.insert(tk.END, *(
+            w.name for w in self._load_roster()
+            if (gender is None or w.gender == gender) and (champ_brand is None or w.brand == champ_brand)
+        ))
 
     def assign_roster_champ(self):
         title = self.rc_title_v.get().strip()
@@ -448,13 +889,19 @@ class StorylineApp:
             return messagebox.showwarning("Missing", "Select a title and at least one wrestler.")
         holder = " & ".join(sels)
         today = datetime.date.today().strftime("%Y-%m-%d")
-        self.cursor.execute(
-            "UPDATE championships SET current_holder=?,won_on=? WHERE title=?",
-            (holder, today, title)
+        with self._tx():
+            self.cursor.execute(
+                "UPDATE championships SET current_holder=?,won_on=? WHERE title=?",
+                (holder, today, title)
+            )
+            self._set_title_holders(title, sels)
+        self._schedule_refresh({"rc_tree","gallery"})
+
+    def _set_title_holders(self, title, holders):
+        self.cursor.execute("DELETE FROM title_holders WHERE title=?", (title,))
+        self.cursor.executemany(
+            "INSERT INTO title_holders(title,wrestler) VALUES(?,?)", [(title, h) for h in holders]
         )
-        self.conn.commit()
-        self.refresh_rc_tree()
-        self.refresh_gallery()
 
     def open_champ_popup(self):
         win = tk.Toplevel(); win.title("Add Championship")
@@ -479,8 +926,7 @@ class StorylineApp:
                 INSERT INTO championships(title,brand,current_holder,type,won_on,gender)
                 VALUES(?,?,?,?,?,?)
             """, (t,b,"",ty,"",g))
-            self.conn.commit()
-            self.refresh_rc_tree(); win.destroy()
+            self._schedule_refresh({"rc_tree"}); win.destroy()
         tk.Button(win, text="Save", command=save).grid(row=4, column=0, pady=5)
         tk.Button(win, text="Cancel", command=win.destroy).grid(row=4, column=1)
 
@@ -494,9 +940,10 @@ class StorylineApp:
         def save():
             new = title_v.get().strip()
             if not new: return
-            self.cursor.execute("UPDATE championships SET title=? WHERE title=?", (new,old))
-            self.conn.commit()
-            self.refresh_rc_tree(); win.destroy()
+            with self._tx():
+                self.cursor.execute("UPDATE championships SET title=? WHERE title=?", (new,old))
+                self.cursor.execute("UPDATE title_holders SET title=? WHERE title=?", (new,old))
+            self._schedule_refresh({"rc_tree"}); win.destroy()
         tk.Button(win, text="Save", command=save).grid(row=1, column=0, pady=5)
         tk.Button(win, text="Cancel", command=win.destroy).grid(row=1, column=1)
 
@@ -505,31 +952,40 @@ class StorylineApp:
         if not sel: return messagebox.showwarning("Select", "Select a championship.")
         title = self.rc_tree.item(sel[0], "values")[0]
         if messagebox.askyesno("Delete", f"Delete '{title}'?"):
-            self.cursor.execute("DELETE FROM championships WHERE title=?", (title,))
-            self.conn.commit()
-            self.refresh_rc_tree()
-            self.refresh_gallery()
+            with self._tx():
+                self.cursor.execute("DELETE FROM championships WHERE title=?", (title,))
+                self.cursor.execute("DELETE FROM title_holders WHERE title=?", (title,))
+            self._schedule_refresh({"rc_tree","gallery"})
 
     def refresh_rc_tree(self):
-        self.rc_tree.delete(*self.rc_tree.get_children())
         b = self.rc_manage_brand_v.get()
-        if b == "All":
-            self.cursor.execute("SELECT title,current_holder FROM championships")
-        else:
-            self.cursor.execute("SELECT title,current_holder FROM championships WHERE brand=?", (b,))
-        rows = self.cursor.fetchall()
-        rows.sort(key=lambda r: self._sort_key(r[0]))
-        for title, holder in rows:
-            self.rc_tree.insert("", "end", values=(title, holder))
+        self.cursor.execute(
+            "SELECT id,title,current_holder FROM championships WHERE (?='All' OR brand=?) ORDER BY sort_key", (b,b)
+        )
+        self._sync_tree(self.rc_tree, [(str(cid), (title, holder)) for cid, title, holder in self.cursor])
+
+    def _sync_tree(self, tree, rows):
+        # Apply only the differences to a Treeview: rows are (iid, values) in display order
+        shown = self._tree_values.setdefault(tree, {})
+        keep = {iid for iid, _ in rows}
+        gone = [iid for iid in shown if iid not in keep]
+        if gone:
+            tree.delete(*gone)
+            for iid in gone: del shown[iid]
+        for idx, (iid, values) in enumerate(rows):
+            if iid not in shown:
+                tree.insert("", idx, iid=iid, values=values)
+            else:
+                if shown[iid] != values:
+                    tree.item(iid, values=values)
+                if tree.index(iid) != idx:
+                    tree.move(iid, "", idx)
+            shown[iid] = values
 
     # ---------- Stable Methods ----------
     def refresh_stable_list(self):
         self.stable_multilist.delete(0, tk.END)
-        self.cursor.execute("SELECT name FROM wrestlers")
-        names = [r[0] for r in self.cursor.fetchall()]
-        names.sort(key=self._sort_key)
-        for nm in names:
-            self.stable_multilist.insert(tk.END, nm)
+        self.stable_multilist.insert(tk.END, *(w.name for w in self._load_roster()))
 
     def add_stable(self):
         name = self.stable_name_e.get().strip()
@@ -538,8 +994,7 @@ class StorylineApp:
             return messagebox.showwarning("Missing", "Enter a name and select at least 2 members.")
         members = ", ".join(sels)
         self.cursor.execute("INSERT INTO stables(stable_name,members) VALUES(?,?)", (name, members))
-        self.conn.commit()
-        self.refresh_stables()
+        self._schedule_refresh({"st_tree"})
 
     def update_stable(self):
         sel = self.st_tree.selection()
@@ -552,8 +1007,7 @@ class StorylineApp:
             return messagebox.showwarning("Missing", "Enter a name and select at least 2 members.")
         members = ", ".join(sels)
         self.cursor.execute("UPDATE stables SET stable_name=?,members=? WHERE stable_name=?", (name, members, old_name))
-        self.conn.commit()
-        self.refresh_stables()
+        self._schedule_refresh({"st_tree"})
 
     def delete_stable(self):
         sel = self.st_tree.selection()
@@ -562,16 +1016,11 @@ class StorylineApp:
         name = self.st_tree.item(sel[0], "values")[0]
         if messagebox.askyesno("Delete", f"Delete '{name}'?"):
             self.cursor.execute("DELETE FROM stables WHERE stable_name=?", (name,))
-            self.conn.commit()
-            self.refresh_stables()
+            self._schedule_refresh({"st_tree"})
 
     def refresh_stables(self):
-        self.st_tree.delete(*self.st_tree.get_children())
-        self.cursor.execute("SELECT stable_name,members FROM stables")
-        rows = self.cursor.fetchall()
-        rows.sort(key=lambda r: self._sort_key(r[0]))
-        for stable_name, members in rows:
-            self.st_tree.insert("", "end", values=(stable_name, members))
+        self.cursor.execute("SELECT id,stable_name,members FROM stables ORDER BY sort_key")
+        self._sync_tree(self.st_tree, [(str(sid), (name, members)) for sid, name, members in self.cursor])
 
     # ---------- Match Generator Tab ----------
     def build_match_generator_tab(self, frame):
@@ -631,16 +1080,19 @@ class StorylineApp:
         canvas.configure(yscrollcommand=vsb.set)
         vsb.pack(side="right", fill="y")
         canvas.pack(side="left", fill="both", expand=True)
-        canvas.bind("<Enter>", lambda e: setattr(self, "_scroll_widget", canvas))
-        canvas.bind("<Leave>", lambda e: setattr(self, "_scroll_widget", None))
+        self.mg_canvas = canvas
 
         self.mg_gallery = tk.Frame(canvas)
+        self._bind_wheel(canvas, canvas, self.mg_gallery)
         canvas.create_window((0,0), window=self.mg_gallery, anchor="nw")
         self.mg_gallery.bind("<Configure>",
             lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
 
         self.mg_gallery_cols = 8
-        self.mg_thumb_refs = []
+        self._mg_gallery_width = None
+        self._mg_resize_after_id = None
+        self._mg_build_after_id = None
+        self._mg_cells = {}
 
         # Match Card area
         cardf = tk.LabelFrame(gf, text="Match Card")
@@ -666,11 +1118,10 @@ class StorylineApp:
                     if h in self.mg_pool:
                         self.mg_vars[i].set(h)
                         self.mg_cbs[i].grid()
-                        self.mg_pool.remove(h)
-                self.mg_pool.sort(key=self._sort_key)
+                        del self.mg_pool[h]
                 for cb in self.mg_cbs:
                     if cb.winfo_ismapped():
-                        cb['values'] = self.mg_pool.copy()
+                        cb['values'] = list(self.mg_pool)
 
     def open_style_add(self):
         win = tk.Toplevel(); win.title("Add Style")
@@ -704,19 +1155,33 @@ class StorylineApp:
 
     def reset_mg_pool(self):
         b = self.mg_brand.get()
-        if b == "All":
-            self.cursor.execute("SELECT name FROM wrestlers")
-        else:
-            self.cursor.execute("SELECT name FROM wrestlers WHERE brand=?", (b,))
-        names = [r[0] for r in self.cursor.fetchall()]
-        names.sort(key=self._sort_key)
-        self.mg_pool = names
+        # Fetch everything the generator needs up front so later lookups stay in memory
+        # The shared roster list is already in sort order, so no Python sort
+        self.mg_meta = {
+            w.name: (w.name, w.brand, w.gender, w.image_path)
+            for w in self._load_roster() if b == "All" or w.brand == b
+        }
+        self.mg_pool = dict.fromkeys(self.mg_meta)
         for v in self.mg_vars: v.set("")
         for cb in self.mg_cbs: cb.grid_remove()
         self.load_match_gen_roster()
+        # Warm the thumbnail cache for the whole brand so later gallery refreshes only relayout
+        for _, _, _, imgpath in self.mg_meta.values():
+            if imgpath and os.path.exists(imgpath) and self._cached_thumb(imgpath) is None:
+                self._request_thumb(imgpath)
 
     def _resize_mg_gallery(self, width):
-        self.mg_gallery_cols = max(1, width // 100)
+        self._mg_gallery_width = width
+        if self._mg_resize_after_id:
+            self.root.after_cancel(self._mg_resize_after_id)
+        self._mg_resize_after_id = self.root.after(150, self._apply_mg_resize)
+
+    def _apply_mg_resize(self):
+        self._mg_resize_after_id = None
+        cols = max(1, self._mg_gallery_width // 100)
+        # Vertical-only resizes leave the column count alone; nothing to relayout once built
+        if cols == self.mg_gallery_cols and self._mg_cells: return
+        self.mg_gallery_cols = cols
         self.refresh_match_gallery()
 
     def load_match_gen_roster(self):
@@ -744,9 +1209,25 @@ class StorylineApp:
             row = self.cursor.fetchone()
             if row:
                 gender, ctype = row
-                # Filter by gender
-                self.mg_pool = [w for w in self.mg_pool if self.get_wrestler_gender(w) == gender]
+                # Filter by gender from the pool metadata
+                genders = self._mg_field(self.mg_pool, 2)
+                self.mg_pool = {w: None for w in self.mg_pool if genders.get(w) == gender}
+
+    def _mg_field(self, names, idx):
+        # name -> mg_meta[idx] (1 brand, 2 gender, 3 image_path); names missing from the
+        # metadata (other brands, edited since the last reset) fall back to one batched query
+        col = ("name","brand","gender","image_path")[idx]
+        out, missing = {}, []
+        for nm in names:
+            row = self.mg_meta.get(nm)
+            if row is None: missing.append(nm)
+            else: out[nm] = row[idx]
+        if missing:
+            out.update(self._wrestler_map(col, missing))
+        return out
+
     def get_wrestler_gender(self, name):
+        if name in self.mg_meta: return self.mg_meta[name][2]
         self.cursor.execute("SELECT gender FROM wrestlers WHERE name=?", (name,))
         r = self.cursor.fetchone()
         return r[0] if r else None
@@ -754,26 +1235,55 @@ class StorylineApp:
     def refresh_match_gallery(self):
         booked = {p for m in self.booked_matches for team in m["teams"] for p in team}
         available = [w for w in self.mg_pool if w not in booked]
-        for w in self.mg_gallery.winfo_children(): w.destroy()
-        self.mg_thumb_refs.clear()
-        for idx,name in enumerate(self.mg_pool):
-            imgpath = self.cursor.execute("SELECT image_path FROM wrestlers WHERE name=?", (name,)).fetchone()[0]
+        # Cancel a build still in flight so rapid brand switches don't stack up work
+        if self._mg_build_after_id:
+            self.root.after_cancel(self._mg_build_after_id)
+        # Hide cells that left the pool; they're kept for reuse when the wrestler returns
+        for name, (cell, _, _) in self._mg_cells.items():
+            if name not in self.mg_pool: cell.grid_forget()
+        self._mg_build_paths = self._mg_field(self.mg_pool, 3)
+        self._mg_build_iter = enumerate(list(self.mg_pool))
+        self._build_mg_chunk()
+
+    def _build_mg_chunk(self, chunk=20):
+        # Build cells a chunk at a time, yielding to the event loop in between
+        self._mg_build_after_id = None
+        built = 0
+        for idx,name in islice(self._mg_build_iter, chunk):
+            built += 1
+            imgpath = self._mg_build_paths.get(name)
             r, c = divmod(idx, self.mg_gallery_cols)
+            if name in self._mg_cells:
+                cell, lbl, old_path = self._mg_cells[name]
+                cell.grid(row=r, column=c, padx=5, pady=5)
+                if old_path != imgpath:
+                    self._set_mg_thumb(lbl, imgpath)
+                    self._mg_cells[name] = (cell, lbl, imgpath)
+                continue
             cell = tk.Frame(self.mg_gallery, bd=1, relief="solid", padx=3, pady=3)
             cell.grid(row=r, column=c, padx=5, pady=5)
-            if imgpath and os.path.exists(imgpath):
-                img = Image.open(imgpath); img.thumbnail((60,60))
-                photo = ImageTk.PhotoImage(img)
-            else:
-                photo = ImageTk.PhotoImage(Image.new("RGB",(60,60),(200,200,200)))
-            lbl = tk.Label(cell, image=photo); lbl.image=photo; lbl.pack()
-            self.mg_thumb_refs.append(photo)
-            tk.Label(cell, text=name, wraplength=60).pack()
+            lbl = tk.Label(cell); lbl.pack()
+            self._set_mg_thumb(lbl, imgpath)
+            name_lbl = tk.Label(cell, text=name, wraplength=60); name_lbl.pack()
             lbl.bind("<Button-1>", lambda e,nm=name: self.add_competitor(nm))
+            self._bind_wheel(self.mg_canvas, cell, lbl, name_lbl)
+            self._mg_cells[name] = (cell, lbl, imgpath)
+        if built == chunk:
+            self._mg_build_after_id = self.root.after(1, self._build_mg_chunk)
+
+    def _set_mg_thumb(self, lbl, imgpath):
+        lbl.configure(image=self._get_placeholder((60,60))); lbl.image = None
+        if imgpath and os.path.exists(imgpath):
+            photo = self._cached_thumb(imgpath)
+            if photo is not None:
+                lbl.configure(image=photo); lbl.image = photo
+            else:
+                # Show the placeholder now and swap the real thumbnail in when the pool finishes
+                self._request_thumb(imgpath, lbl)
 
     def add_competitor(self, name):
         if name not in self.mg_pool: return
-        self.mg_pool.remove(name)
+        del self.mg_pool[name]
         for v,cb in zip(self.mg_vars, self.mg_cbs):
             if cb.winfo_ismapped() and not v.get():
                 v.set(name)
@@ -781,7 +1291,7 @@ class StorylineApp:
         self.refresh_match_gallery()
         for cb in self.mg_cbs:
             if cb.winfo_ismapped():
-                cb['values'] = self.mg_pool.copy()
+                cb['values'] = list(self.mg_pool)
 
     def update_mg_formats(self, *_):
         opts = {
@@ -803,11 +1313,10 @@ class StorylineApp:
         nums = list(map(int, fmt.split(" v ")))
         comps = [v.get() for v in self.mg_vars if v.get()]
         for p in comps:
-            if p in self.mg_pool: self.mg_pool.remove(p)
-        self.mg_pool.sort(key=self._sort_key)
+            self.mg_pool.pop(p, None)
         for cb in self.mg_cbs:
             if cb.winfo_ismapped():
-                cb['values'] = self.mg_pool.copy()
+                cb['values'] = list(self.mg_pool)
         teams = []; idx = 0
         for n in nums:
             teams.append(comps[idx:idx+n]); idx += n
@@ -817,86 +1326,127 @@ class StorylineApp:
             "championship": champ if champ and champ!="None" else None
         })
         for v in self.mg_vars: v.set("")
-        self.refresh_card()
+        self._append_match_frame()
         self.refresh_match_gallery()
 
     def clear_card(self):
-        b = self.mg_brand.get()
-        for m in self.booked_matches:
-            for team in m["teams"]:
-                for p in team:
-                    if p not in self.mg_pool:
-                        if b=="All" or self.get_wrestler_brand(p)==b:
-                            self.mg_pool.append(p)
-        self.mg_pool.sort(key=self._sort_key)
+        self._return_to_pool(p for m in self.booked_matches for team in m["teams"] for p in team)
         self.booked_matches = []
         self.refresh_card()
         self.refresh_match_gallery()
 
+    def _wrestler_map(self, col, names):
+        # name -> col for a batch of wrestlers in one query
+        names = list(names)
+        if not names: return {}
+        self.cursor.execute(_SQL_WRESTLER_FIELD[col], (json.dumps(names),))
+        return dict(self.cursor.fetchall())
+
+    def _image_paths(self, names):
+        return self._wrestler_map("image_path", names)
+
+    def _return_to_pool(self, names):
+        # Put wrestlers back in the pool if they match the current brand filter, keeping sort order
+        b = self.mg_brand.get()
+        names = [p for p in dict.fromkeys(names) if p not in self.mg_pool]
+        brands = self._mg_field(names, 1) if b != "All" else {}
+        names = [p for p in names if b=="All" or brands.get(p)==b]
+        if names:
+            self.mg_pool = dict.fromkeys(sorted([*self.mg_pool, *names], key=self._sort_key))
+
     def get_wrestler_brand(self, name):
+        if name in self.mg_meta: return self.mg_meta[name][1]
         self.cursor.execute("SELECT brand FROM wrestlers WHERE name=?", (name,))
         row = self.cursor.fetchone()
         return row[0] if row else None
 
     # ---------- Match Card Display & Reordering ----------
     def refresh_card(self):
+        # Full rebuild; single-match edits go through _append_match_frame / move_match / delete_match
         for w in self.card_frame.winfo_children(): w.destroy()
-        for i, m in enumerate(self.booked_matches):
-            mf = tk.LabelFrame(self.card_frame, text=f"Match {i+1}", bd=1, relief="solid", padx=5, pady=5)
-            row, col = divmod(i, 2)
-            mf.grid(row=row, column=col, padx=5, pady=5, sticky="nw")
-            # Teams
-            for ti,team in enumerate(m["teams"]):
-                tf = tk.Frame(mf); tf.pack(side="left", padx=2)
-                for p in team:
-                    imgpath = self.cursor.execute(
-                        "SELECT image_path FROM wrestlers WHERE name=?", (p,)
-                    ).fetchone()[0]
-                    if imgpath and os.path.exists(imgpath):
-                        img = Image.open(imgpath); img.thumbnail((60,60))
-                        photo = ImageTk.PhotoImage(img)
-                    else:
-                        photo = ImageTk.PhotoImage(Image.new("RGB",(60,60),(200,200,200)))
-                    lbl = tk.Label(tf, image=photo); lbl.image=photo; lbl.pack()
-                    tk.Label(tf, text=p, wraplength=60).pack()
-                if ti < len(m["teams"]) - 1:
-                    tk.Label(mf, text="v.", font=("Arial",12,"bold")).pack(side="left", padx=2)
-            # Champion vs Challenger line
-            if m["championship"]:
-                self.cursor.execute("SELECT current_holder FROM championships WHERE title=?", (m["championship"],))
-                holders = self.cursor.fetchone()[0].split(" & ")
-                champ_team = next(t for t in m["teams"] if any(h in t for h in holders))
-                chall_team = next(t for t in m["teams"] if t is not champ_team)
-                text = f"{' & '.join(champ_team)} (Champion) vs {' & '.join(chall_team)} (Challenger)"
-                tk.Label(mf, text=text, font=(self.font,9,"italic")).pack(pady=(2,2))
-            # Style & Title info
-            info = f"Style: {m['style']}"
-            if m["championship"]:
-                info += f"  |  Title: {m['championship']}"
-            tk.Label(mf, text=info, font=(self.font,9,"italic")).pack(pady=(2,5))
-            # Controls
-            ctrl = tk.Frame(mf); ctrl.pack(pady=2)
-            tk.Label(ctrl, text="Winner:").pack(side="left")
-            win_v = tk.StringVar()
-            tlabels = [" & ".join(t) for t in m["teams"]]
-            win_cb = ttk.Combobox(ctrl, textvariable=win_v, values=tlabels,
-                                  state="readonly", width=12)
-            win_cb.pack(side="left")
-            win_cb.bind("<<ComboboxSelected>>", lambda e, idx=i: self.record_result(idx))
-            tk.Button(ctrl, text="↑", command=lambda idx=i: self.move_match(idx, -1)).pack(side="left")
-            tk.Button(ctrl, text="↓", command=lambda idx=i: self.move_match(idx, 1)).pack(side="left")
-            tk.Button(ctrl, text="Delete", command=lambda idx=i: self.delete_match(idx)).pack(side="left", padx=2)
+        paths, holders_by_title = self._card_lookups(self.booked_matches)
+        self._match_frames = [self._build_match_frame(i, m, paths, holders_by_title)
+                              for i, m in enumerate(self.booked_matches)]
+
+    def _card_lookups(self, matches):
+        # Batch the per-wrestler image and per-title holder lookups for a set of matches
+        paths = self._image_paths({p for m in matches for team in m["teams"] for p in team})
+        champs = list({m["championship"] for m in matches if m["championship"]})
+        holders_by_title = {}
+        if champs:
+            self.cursor.execute(_SQL_TITLE_HOLDERS, (json.dumps(champs),))
+            holders_by_title = dict(self.cursor.fetchall())
+        return paths, holders_by_title
+
+    def _append_match_frame(self):
+        m = self.booked_matches[-1]
+        self._match_frames.append(
+            self._build_match_frame(len(self.booked_matches)-1, m, *self._card_lookups([m]))
+        )
+
+    def _grid_match_frame(self, i):
+        mf = self._match_frames[i]
+        row, col = divmod(i, 2)
+        mf.grid(row=row, column=col, padx=5, pady=5, sticky="nw")
+        mf.config(text=f"Match {i+1}")
+
+    def _build_match_frame(self, i, m, paths, holders_by_title):
+        mf = tk.LabelFrame(self.card_frame, text=f"Match {i+1}", bd=1, relief="solid", padx=5, pady=5)
+        row, col = divmod(i, 2)
+        mf.grid(row=row, column=col, padx=5, pady=5, sticky="nw")
+        # Teams
+        for ti,team in enumerate(m["teams"]):
+            tf = tk.Frame(mf); tf.pack(side="left", padx=2)
+            for p in team:
+                imgpath = paths.get(p)
+                if imgpath and os.path.exists(imgpath):
+                    photo = self._get_thumb(imgpath)
+                else:
+                    photo = self._get_placeholder((60,60))
+                lbl = tk.Label(tf, image=photo); lbl.image=photo; lbl.pack()
+                tk.Label(tf, text=p, wraplength=60).pack()
+            if ti < len(m["teams"]) - 1:
+                tk.Label(mf, text="v.", font=("Arial",12,"bold")).pack(side="left", padx=2)
+        # Champion vs Challenger line
+        if m["championship"]:
+            holders = holders_by_title[m["championship"]].split(" & ")
+            champ_team = next(t for t in m["teams"] if any(h in t for h in holders))
+            chall_team = next(t for t in m["teams"] if t is not champ_team)
+            text = f"{' & '.join(champ_team)} (Champion) vs {' & '.join(chall_team)} (Challenger)"
+            tk.Label(mf, text=text, font=self._italic9).pack(pady=(2,2))
+        # Style & Title info
+        info = f"Style: {m['style']}"
+        if m["championship"]:
+            info += f"  |  Title: {m['championship']}"
+        tk.Label(mf, text=info, font=self._italic9).pack(pady=(2,5))
+        # Controls
+        ctrl = tk.Frame(mf); ctrl.pack(pady=2)
+        tk.Label(ctrl, text="Winner:").pack(side="left")
+        win_v = tk.StringVar()
+        tlabels = [" & ".join(t) for t in m["teams"]]
+        win_cb = ttk.Combobox(ctrl, textvariable=win_v, values=tlabels,
+                              state="readonly", width=12)
+        win_cb.pack(side="left")
+        # Resolve the position at click time since frames move without being rebuilt
+        pos = lambda: self._match_frames.index(mf)
+        win_cb.bind("<<ComboboxSelected>>", lambda e: self.record_result(pos()))
+        tk.Button(ctrl, text="↑", command=lambda: self.move_match(pos(), -1)).pack(side="left")
+        tk.Button(ctrl, text="↓", command=lambda: self.move_match(pos(), 1)).pack(side="left")
+        tk.Button(ctrl, text="Delete", command=lambda: self.delete_match(pos())).pack(side="left", padx=2)
+        return mf
 
     def move_match(self, idx, delta):
         new = max(0, min(len(self.booked_matches)-1, idx + delta))
         if new != idx:
             m = self.booked_matches.pop(idx)
             self.booked_matches.insert(new, m)
-            self.refresh_card()
+            self._match_frames.insert(new, self._match_frames.pop(idx))
+            for i in range(min(idx, new), max(idx, new)+1):
+                self._grid_match_frame(i)
 
     def record_result(self, index):
         m = self.booked_matches[index]
-        mf = self.card_frame.grid_slaves(row=index//2, column=index%2)[0]
+        mf = self._match_frames[index]
         ctrl = mf.winfo_children()[-1]
         win_cb = ctrl.winfo_children()[1]
         winner_label = win_cb.get()
@@ -904,39 +1454,45 @@ class StorylineApp:
         teams = m["teams"]
         winners = next((t for t in teams if " & ".join(t) == winner_label), [])
         losers = [p for team in teams for p in team if p not in winners]
-        # Update records
-        for w in winners:
-            self.cursor.execute("INSERT OR IGNORE INTO records(wrestler) VALUES(?)", (w,))
-            self.cursor.execute("UPDATE records SET wins=wins+1 WHERE wrestler=?", (w,))
-        for l in losers:
-            self.cursor.execute("INSERT OR IGNORE INTO records(wrestler) VALUES(?)", (l,))
-            self.cursor.execute("UPDATE records SET losses=losses+1 WHERE wrestler=?", (l,))
-        # Championship change
-        champ = m["championship"]
-        if champ and winners:
-            today_str = self.card_calendar.get_date()
-            self.cursor.execute("UPDATE championships SET current_holder=?,won_on=? WHERE title=?", (winners[0], today_str, champ))
-        # Save to match_history
-        card_date = self.card_calendar.get_date()
-        self.cursor.execute("""
-            INSERT INTO match_history(card_date,match_number,winner,losers,style,championship)
-            VALUES(?,?,?,?,?,?)
-        """, (
-            card_date,
-            index+1,
-            winner_label,
-            ",".join(losers),
-            m["style"],
-            champ or ""
-        ))
-        self.conn.commit()
+        # The result is dated from the Cards tab calendar, which only exists once that tab is built
+        self._ensure_tab(self.cards_tab)
+        with self._tx():
+            # Update records: one upsert per side instead of insert+update per wrestler
+            self.cursor.executemany(
+                "INSERT INTO records(wrestler,wins) VALUES(?,1) ON CONFLICT(wrestler) DO UPDATE SET wins=wins+1",
+                [(w,) for w in winners]
+            )
+            self.cursor.executemany(
+                "INSERT INTO records(wrestler,losses) VALUES(?,1) ON CONFLICT(wrestler) DO UPDATE SET losses=losses+1",
+                [(l,) for l in losers]
+            )
+            # Championship change
+            champ = m["championship"]
+            if champ and winners:
+                today_str = self.card_calendar.get_date()
+                self.cursor.execute("UPDATE championships SET current_holder=?,won_on=? WHERE title=?", (winners[0], today_str, champ))
+                self._set_title_holders(champ, winners[:1])
+            # Save to match_history
+            card_date = self.card_calendar.get_date()
+            self.cursor.execute("""
+                INSERT INTO match_history(card_date,match_number,winner,losers,style,championship)
+                VALUES(?,?,?,?,?,?)
+            """, (
+                card_date,
+                index+1,
+                winner_label,
+                ",".join(losers),
+                m["style"],
+                champ or ""
+            ))
+            match_id = self.cursor.lastrowid
+            self.cursor.executemany(
+                "INSERT INTO match_participants(match_id,wrestler,role) VALUES(?,?,?)",
+                [(match_id, w, "W") for w in winners] + [(match_id, l, "L") for l in losers]
+            )
         # Return losers to pool
-        for p in losers:
-            if p not in self.mg_pool:
-                if self.mg_brand.get()=="All" or self.get_wrestler_brand(p)==self.mg_brand.get():
-                    self.mg_pool.append(p)
-        self.mg_pool.sort(key=self._sort_key)
-        self.refresh_stats()
+        self._return_to_pool(losers)
+        self._schedule_refresh({"stats"})
         self.refresh_match_gallery()
         # Gray out combobox & disable buttons
         win_cb.config(state="disabled")
@@ -946,16 +1502,15 @@ class StorylineApp:
 
     def delete_match(self, index):
         m = self.booked_matches.pop(index)
-        for team in m["teams"]:
-            for p in team:
-                if p not in self.mg_pool:
-                    if self.mg_brand.get()=="All" or self.get_wrestler_brand(p)==self.mg_brand.get():
-                        self.mg_pool.append(p)
-        self.mg_pool.sort(key=self._sort_key)
-        self.refresh_card(); self.refresh_match_gallery()
+        self._match_frames.pop(index).destroy()
+        for i in range(index, len(self._match_frames)):
+            self._grid_match_frame(i)
+        self._return_to_pool(p for team in m["teams"] for p in team)
+        self.refresh_match_gallery()
 
     # ---------- Finalize & Save Card ----------
     def finalize_card(self):
+        self._ensure_tab(self.cards_tab)
         win = tk.Toplevel(); win.title("Finalize & Save Card")
         tk.Label(win, text="Card Name:").grid(row=0, column=0, sticky="e")
         name_v = tk.StringVar()
@@ -980,14 +1535,13 @@ class StorylineApp:
             if not nm or not bd:
                 return messagebox.showwarning("Missing", "Name & Brand required.", parent=win)
             data = json.dumps(self.booked_matches)
-            self.cursor.execute("""
-                INSERT INTO cards(name,brand,card_date,card_data)
-                VALUES(?,?,?,?)
-            """, (nm,bd,dt,data))
-            self.conn.commit()
-            self.on_card_date_selected()
-            self.refresh_stats()
-            self.refresh_gallery()
+            with self._tx():
+                self.cursor.execute("""
+                    INSERT INTO cards(name,brand,card_date,card_data)
+                    VALUES(?,?,?,?)
+                """, (nm,bd,dt,data))
+            self.on_card_date_selected(force=True)
+            self._schedule_refresh({"stats","gallery"})
             win.destroy()
         tk.Button(win, text="Save", command=save).grid(row=3, column=0, pady=5)
         tk.Button(win, text="Cancel", command=win.destroy).grid(row=3, column=1)
@@ -1011,8 +1565,11 @@ class StorylineApp:
         tk.Button(btnf, text="Load", command=self.load_card_from_list).pack(side="left", padx=5)
         tk.Button(btnf, text="Delete", command=self.delete_card_from_list).pack(side="left", padx=5)
 
-    def on_card_date_selected(self):
+    def on_card_date_selected(self, force=False):
+        # Only re-query when the picked date actually changes (or a card on it was saved/deleted)
         date = self.card_calendar.get_date()
+        if date == self._last_card_date and not force: return
+        self._last_card_date = date
         self.card_listbox.delete(0, tk.END)
         self.card_ids = []
         self.cursor.execute("SELECT id,name FROM cards WHERE card_date=?", (date,))
@@ -1034,13 +1591,22 @@ class StorylineApp:
         cid = self.card_ids[sel[0]]
         if messagebox.askyesno("Delete", "Delete this saved card?"):
             self.cursor.execute("DELETE FROM cards WHERE id=?", (cid,))
-            self.conn.commit()
-            self.on_card_date_selected()
+            self._card_json_cache.pop(cid, None)
+            self.on_card_date_selected(force=True)
+
+    def _load_card(self, cid):
+        # (name, brand, card_date, matches) with card_data parsed once per card id
+        if cid not in self._card_json_cache:
+            self.cursor.execute("SELECT name,brand,card_date,card_data FROM cards WHERE id=?", (cid,))
+            name, brand, card_date, data = self.cursor.fetchone()
+            self._card_json_cache[cid] = (name, brand, card_date, json.loads(data))
+        return self._card_json_cache[cid]
 
     def load_card_by_id(self, cid):
-        self.cursor.execute("SELECT card_data FROM cards WHERE id=?", (cid,))
-        data = self.cursor.fetchone()[0]
-        self.booked_matches = json.loads(data)
+        # Copy so editing the booked card never mutates the cached parse
+        matches = self._load_card(cid)[3]
+        self._ensure_tab(self.match_gen_tab)
+        self.booked_matches = [dict(m, teams=[list(t) for t in m["teams"]]) for m in matches]
         self.refresh_card()
         messagebox.showinfo("Loaded", "Card loaded into Match Generator.")
 
@@ -1048,15 +1614,15 @@ class StorylineApp:
         sel = self.card_listbox.curselection()
         if not sel: return
         cid = self.card_ids[sel[0]]
-        self.cursor.execute("SELECT name,brand,card_date FROM cards WHERE id=?", (cid,))
-        name, brand, card_date = self.cursor.fetchone()
-        self.cursor.execute("SELECT card_data FROM cards WHERE id=?", (cid,))
-        card_data = json.loads(self.cursor.fetchone()[0])
+        name, brand, card_date, card_data = self._load_card(cid)
+        # match_number -> (winner, losers); first row wins, as the old linear scan did
         self.cursor.execute("""
-            SELECT match_number,winner,losers,style,championship
+            SELECT match_number,winner,losers
             FROM match_history WHERE card_date=? ORDER BY match_number
         """, (card_date,))
-        history = self.cursor.fetchall()
+        history = {}
+        for mnum, winner, losers in self.cursor:
+            history.setdefault(mnum, (winner, losers))
 
         win = tk.Toplevel(); win.title(f"Card Details: {name}")
         tk.Label(win, text=name, font=("Arial",14,"bold")).pack(pady=5)
@@ -1067,9 +1633,7 @@ class StorylineApp:
             prefix = "[Championship Match] " if m["championship"] else ""
             style = m["style"]
             champ = m["championship"]
-            h = next((h for h in history if h[0]==mn+1), None)
-            winner, losers = ("TBD","")
-            if h: _, winner, losers, _, _ = h
+            winner, losers = history.get(mn+1, ("TBD",""))
             text = f"{prefix}Match {mn+1}: {style}"
             if champ: text += f" (Title: {champ})"
             text += f"\nWinner: {winner}"
@@ -1090,19 +1654,20 @@ class StorylineApp:
 
     def apply_font(self):
         self.font = self.font_v.get()
-        self.root.option_add("*Font", (self.font, 10))
+        for f in (self._app_font, self._italic8, self._italic9):
+            f.configure(family=self.font)
         self.save_settings()
         messagebox.showinfo("Font Applied", f"Global font set to {self.font}.")
 
     def reset_history(self):
         if messagebox.askyesno("Reset", "Delete all match history?"):
-            self.cursor.execute("DELETE FROM match_history")
-            self.conn.commit()
+            with self._tx():
+                self.cursor.execute("DELETE FROM match_participants")
+                self.cursor.execute("DELETE FROM match_history")
 
     def reset_records(self):
         if messagebox.askyesno("Reset", "Reset all win/loss?"):
             self.cursor.execute("UPDATE records SET wins=0,losses=0")
-            self.conn.commit()
 
 if __name__ == "__main__":
     root = tk.Tk()
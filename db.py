@@ -0,0 +1,23 @@
+import os, sqlite3
+from functools import lru_cache
+
+DB_PATH = "data/roster.db"
+
+# WAL + relaxed sync: commits append to the log instead of fsyncing twice
+PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+    PRAGMA mmap_size=268435456;
+"""
+
+# One connection per process, shared by the app and the setup scripts.
+# Autocommit mode: single statements commit on their own, multi-statement
+# writes wrap themselves in BEGIN/COMMIT.
+@lru_cache(maxsize=None)
+def get_conn():
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, cached_statements=256)
+    conn.executescript(PRAGMAS)
+    return conn
@@ -1,20 +1,28 @@
-import sqlite3
+import contextlib
+from db import get_conn
 
-conn = sqlite3.connect("data/roster.db")
-cursor = conn.cursor()
+# Runs on the shared connection and leaves it open for the caller
+def upgrade_schema(conn=None):
+    conn = conn or get_conn()
+    cursor = conn.cursor()
+    # Add missing columns if they don't exist; checked against the table itself rather than
+    # PRAGMA user_version, which belongs to the app's own migrations
+    cursor.execute("PRAGMA table_info(wrestlers)")
+    cols = {c[1] for c in cursor.fetchall()}
+    if not cols: return  # No wrestlers table yet; nothing to upgrade
+    missing = [col for col in ("brand", "team") if col not in cols]
+    if not missing: return
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        for col in missing:
+            cursor.execute(f"ALTER TABLE wrestlers ADD COLUMN {col} TEXT")
+    except Exception:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
 
-# Add missing columns if they don't exist
-try:
-    cursor.execute("ALTER TABLE wrestlers ADD COLUMN brand TEXT")
-except sqlite3.OperationalError:
-    pass  # Column already exists
-
-try:
-    cursor.execute("ALTER TABLE wrestlers ADD COLUMN team TEXT")
-except sqlite3.OperationalError:
-    pass  # Column already exists
-
-conn.commit()
-conn.close()
-
-print("Table updated.")
+if __name__ == "__main__":
+    with contextlib.closing(get_conn()) as conn:
+        upgrade_schema(conn)
+    print("Table updated.")